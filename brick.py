@@ -1,7 +1,24 @@
 import tkinter as tk
 import random
 import math
-from PIL import Image, ImageTk
+import time
+from PIL import Image, ImageDraw, ImageTk
+
+PADDLE_MAX_ANGLE = math.radians(75)
+PADDLE_STEPS = 32
+
+FRAME_MS = 16
+FRAME_DT = FRAME_MS / 1000
+MAX_STEPS = 2
+
+# indexed by remaining hits, anything tougher falls back to grey
+BRICK_COLORS = ('#CCCCCC', '#4535AA', '#ED639E', '#8FE1A2')
+
+# launch directions between 30 and 150 degrees, always heading up
+BALL_INIT_DIRS = [
+    (math.cos(math.radians(a)), -abs(math.sin(math.radians(a))))
+    for a in range(30, 151, 4)
+]
 
 
 # ============================
@@ -20,30 +37,68 @@ class GameObject:
 
 
 # ============================
-#  BRICK
+#  BRICK SHEET
 # ============================
-class Brick(GameObject):
-    COLORS = {1: '#4535AA', 2: '#ED639E', 3: '#8FE1A2'}
+class BrickSheet(GameObject):
+    # all bricks of a level are painted into one image, so the canvas
+    # holds a single item instead of one rectangle per brick
+    def __init__(self, canvas, x, y, width, height):
+        self.x = x
+        self.y = y
+        self.img = Image.new('RGBA', (width, height), (0, 0, 0, 0))
+        self.draw = ImageDraw.Draw(self.img)
+        self.photo = ImageTk.PhotoImage(self.img)
+        item = canvas.create_image(x, y, image=self.photo, anchor='nw')
+        super().__init__(canvas, item)
+
+    def paint(self, x1, y1, x2, y2, color):
+        box = (x1 - self.x, y1 - self.y, x2 - self.x - 1, y2 - self.y - 1)
+        if color is None:
+            self.draw.rectangle(box, fill=(0, 0, 0, 0))
+        else:
+            self.draw.rectangle(box, fill=color, outline='black')
 
-    def __init__(self, canvas, x, y, hits):
+    def clear(self):
+        self.draw.rectangle((0, 0) + self.img.size, fill=(0, 0, 0, 0))
+
+    def flush(self):
+        self.photo.paste(self.img)
+
+
+# ============================
+#  BRICK
+# ============================
+class Brick:
+    def __init__(self, sheet, x, y, hits):
+        self.sheet = sheet
         self.width = 75
         self.height = 20
         self.hits = hits
-        color = Brick.COLORS.get(hits, '#CCCCCC')
-        item = canvas.create_rectangle(
-            x - self.width / 2, y - self.height / 2,
-            x + self.width / 2, y + self.height / 2,
-            fill=color, tags='brick'
-        )
-        super().__init__(canvas, item)
+        self.x1 = x - self.width / 2
+        self.y1 = y - self.height / 2
+        self.x2 = x + self.width / 2
+        self.y2 = y + self.height / 2
+        self._color = None
+        self.paint(BRICK_COLORS[hits] if hits < 4 else '#CCCCCC')
+
+    def paint(self, color):
+        # returns whether the sheet actually changed
+        if color == self._color:
+            return False
+        self.sheet.paint(self.x1, self.y1, self.x2, self.y2, color)
+        self._color = color
+        return True
 
     def hit(self):
         self.hits -= 1
         if self.hits <= 0:
-            self.delete()
+            self.paint(None)
+            self.sheet.flush()
             return True
         else:
-            self.canvas.itemconfig(self.item, fill=Brick.COLORS.get(self.hits, '#CCCCCC'))
+            hits = self.hits
+            if self.paint(BRICK_COLORS[hits] if hits < 4 else '#CCCCCC'):
+                self.sheet.flush()
             return False
 
 
@@ -54,20 +109,27 @@ class Paddle(GameObject):
     def __init__(self, canvas, x, y, width=110, height=12):
         self.width = width
         self.height = height
+        self._x1, self._y1 = x - width / 2, y - height / 2
+        self._x2, self._y2 = x + width / 2, y + height / 2
         item = canvas.create_rectangle(
-            x - width / 2, y - height / 2,
-            x + width / 2, y + height / 2,
+            self._x1, self._y1, self._x2, self._y2,
             fill='#333333', tags='paddle'
         )
         super().__init__(canvas, item)
         self.canvas_width = int(self.canvas['width'])
+        self.center_x = x
+
+    def coords(self):
+        # cached on our side, avoids a Tcl round-trip per read
+        return self._x1, self._y1, self._x2, self._y2
 
     def move_to(self, x_center):
         half = self.width / 2
         x1 = max(0, x_center - half)
         x2 = min(self.canvas_width, x_center + half)
-        y1, y2 = self.coords()[1], self.coords()[3]
-        self.canvas.coords(self.item, x1, y1, x2, y2)
+        self.canvas.coords(self.item, x1, self._y1, x2, self._y2)
+        self._x1, self._x2 = x1, x2
+        self.center_x = (x1 + x2) / 2
 
 
 # ============================
@@ -76,23 +138,35 @@ class Paddle(GameObject):
 class Ball(GameObject):
     def __init__(self, canvas, x, y, radius=8, speed=5):
         self.radius = radius
+        self._x1, self._y1 = x - radius, y - radius
+        self._x2, self._y2 = x + radius, y + radius
         item = canvas.create_oval(
-            x - radius, y - radius,
-            x + radius, y + radius,
+            self._x1, self._y1, self._x2, self._y2,
             fill='#FFAA00', tags='ball'
         )
         super().__init__(canvas, item)
-        angle = random.uniform(30, 150)
-        rad = math.radians(angle)
-        self.vx = speed * math.cos(rad)
-        self.vy = -abs(speed * math.sin(rad))
+        cx, cy = random.choice(BALL_INIT_DIRS)
+        self.vx = speed * cx
+        self.vy = speed * cy
         self.speed = speed
 
     def move(self):
-        self.canvas.move(self.item, self.vx, self.vy)
+        self.shift(self.vx, self.vy)
+
+    def shift(self, dx, dy):
+        self._x1 += dx
+        self._y1 += dy
+        self._x2 += dx
+        self._y2 += dy
+        self.canvas.coords(self.item, self._x1, self._y1, self._x2, self._y2)
+
+    def place(self, x, y):
+        r = self.radius
+        self._x1, self._y1, self._x2, self._y2 = x - r, y - r, x + r, y + r
+        self.canvas.coords(self.item, self._x1, self._y1, self._x2, self._y2)
 
     def position(self):
-        return self.canvas.coords(self.item)
+        return self._x1, self._y1, self._x2, self._y2
 
     def bounce_x(self):
         self.vx = -self.vx
@@ -101,8 +175,7 @@ class Ball(GameObject):
         self.vy = -self.vy
 
     def set_speed(self, speed):
-        mag = math.hypot(self.vx, self.vy)
-        scale = speed / mag
+        scale = speed / math.sqrt(self.vx * self.vx + self.vy * self.vy)
         self.vx *= scale
         self.vy *= scale
         self.speed = speed
@@ -134,6 +207,11 @@ class BrickBreaker:
         self.started = False
         self.paused = False
 
+        # paddle bounce angle lookup, offsets quantized over [-1, 1]
+        offsets = [-1 + i / PADDLE_STEPS for i in range(2 * PADDLE_STEPS + 1)]
+        self._paddle_sin = [math.sin(o * PADDLE_MAX_ANGLE) for o in offsets]
+        self._paddle_cos = [math.cos(o * PADDLE_MAX_ANGLE) for o in offsets]
+
         self.paddle = Paddle(self.canvas, width / 2, height - 30)
         self.ball = Ball(self.canvas, width / 2, height - 60)
 
@@ -149,8 +227,13 @@ class BrickBreaker:
             font=('Helvetica', 16, 'bold'),
             fill='white'
         )
+        self._last_score_str = None
+        self._last_level_str = None
 
         self.bricks = []
+        self.brick_sheet = None
+        self.brick_grid = []
+        self.grid_rows = self.grid_cols = 0
         self.build_level(self.level)
 
         self.instr = self.canvas.create_text(
@@ -167,48 +250,83 @@ class BrickBreaker:
         self.root.bind('p', lambda e: self.toggle_pause())
         self.root.bind('r', lambda e: self.restart())
 
+        self._last_t = time.perf_counter()
+        self._acc = 0.0
+        self._after_id = None
         self.loop()
         self.root.mainloop()
 
     # ========== LEVEL SYSTEM ==========
     def build_level(self, level):
-        for b in self.bricks:
-            b.delete()
         self.bricks.clear()
 
-        rows = min(6, 3 + level)
+        max_rows = 6
+        rows = min(max_rows, 3 + level)
         cols = 8
         mx = 60
         spacing_x = (self.width - 2 * mx) / cols
         top_y = 60
+        row_h = 26
+
+        # bricks sit on a regular grid, so the ball's bounding box maps
+        # straight to the few cells it can touch
+        self.brick_grid = [None] * (rows * cols)
+        self.grid_rows, self.grid_cols = rows, cols
+        self.grid_x0 = mx
+        self.grid_y0 = top_y - 10
+        self.cell_w = spacing_x
+        self.cell_h = row_h
+
+        # the sheet is sized for the tallest level and reused between
+        # levels, so a rebuild only repaints pixels
+        if self.brick_sheet is None:
+            self.brick_sheet = BrickSheet(
+                self.canvas, mx, self.grid_y0,
+                int(cols * spacing_x), max_rows * row_h
+            )
+            self.canvas.tag_lower(self.brick_sheet.item, self.paddle.item)
+        else:
+            self.brick_sheet.clear()
 
         for r in range(rows):
             for c in range(cols):
                 x = mx + spacing_x * c + spacing_x / 2
-                y = top_y + r * 26
+                y = top_y + r * row_h
                 hits = min(3, 1 + (r + level) // 2)
-                self.bricks.append(Brick(self.canvas, x, y, hits))
+                b = Brick(self.brick_sheet, x, y, hits)
+                b._idx = len(self.bricks)
+                self.bricks.append(b)
+                self.brick_grid[r * cols + c] = b
+        self.brick_sheet.flush()
 
     # ========== INPUT ==========
     def mouse_move(self, e):
         self.paddle.move_to(e.x)
         if not self.started and not self.paused:
-            px = (self.paddle.coords()[0] + self.paddle.coords()[2]) / 2
-            cx = (self.ball.position()[0] + self.ball.position()[2]) / 2
-            dx = px - cx
-            self.canvas.move(self.ball.item, dx, 0)
+            px = self.paddle.center_x
+            by1, by2 = self.ball.position()[1::2]
+            self.ball.place(px, (by1 + by2) / 2)
 
     def keyboard_move(self, delta):
-        x = (self.paddle.coords()[0] + self.paddle.coords()[2]) / 2 + delta
+        x = self.paddle.center_x + delta
         self.paddle.move_to(x)
 
     def start_ball(self):
         if not self.started:
             self.started = True
-            self.canvas.delete(self.instr)
+            self.canvas.itemconfigure(self.instr, state='hidden')
 
     def toggle_pause(self):
         self.paused = not self.paused
+        # the loop stays idle while paused and is kicked again on resume
+        if self.paused:
+            if self._after_id is not None:
+                self.root.after_cancel(self._after_id)
+                self._after_id = None
+        elif self.lives > 0:
+            self._last_t = time.perf_counter()
+            self._acc = 0.0
+            self._after_id = self.root.after(FRAME_MS, self.loop)
 
     def restart(self):
         self.canvas.delete("all")
@@ -227,62 +345,101 @@ class BrickBreaker:
             paddle_center = (px1 + px2) / 2
             ball_center = (bx1 + bx2) / 2
             offset = (ball_center - paddle_center) / (self.paddle.width / 2)
-            angle = offset * math.radians(75)
+            idx = int((offset + 1) * PADDLE_STEPS + 0.5)
+            idx = min(2 * PADDLE_STEPS, max(0, idx))
             speed = self.ball.speed
-            self.ball.vx = speed * math.sin(angle)
-            self.ball.vy = -abs(speed * math.cos(angle))
-
-        overlap = self.canvas.find_overlapping(bx1, by1, bx2, by2)
-        for item in overlap:
-            if 'brick' in self.canvas.gettags(item):
-                for b in self.bricks:
-                    if b.item == item:
-                        destroyed = b.hit()
-                        self.score += 10 if destroyed else 5
-                        if destroyed:
-                            self.bricks.remove(b)
-                        self.ball.bounce_y()
-                        break
+            self.ball.vx = speed * self._paddle_sin[idx]
+            self.ball.vy = -abs(speed * self._paddle_cos[idx])
+
+        rows, cols = self.grid_rows, self.grid_cols
+        # most frames the ball is nowhere near the bricks
+        if by1 > self.grid_y0 + rows * self.cell_h or by2 < self.grid_y0:
+            return
+        grid = self.brick_grid
+        c0 = max(0, int((bx1 - self.grid_x0) // self.cell_w))
+        c1 = min(cols - 1, int((bx2 - self.grid_x0) // self.cell_w))
+        r0 = max(0, int((by1 - self.grid_y0) // self.cell_h))
+        r1 = min(rows - 1, int((by2 - self.grid_y0) // self.cell_h))
+        for r in range(r0, r1 + 1):
+            for c in range(c0, c1 + 1):
+                b = grid[r * cols + c]
+                if b is None:
+                    continue
+                if bx2 < b.x1 or bx1 > b.x2 or by2 < b.y1 or by1 > b.y2:
+                    continue
+                destroyed = b.hit()
+                self.score += 10 if destroyed else 5
+                if destroyed:
+                    grid[r * cols + c] = None
+                    # order doesn't matter, swap the last brick into the gap
+                    last = self.bricks[-1]
+                    last._idx = b._idx
+                    self.bricks[b._idx] = last
+                    self.bricks.pop()
+                self.ball.bounce_y()
 
     # ========== GAME LOOP ==========
+    # one fixed physics timestep, returns False on game over
+    def step(self):
+        self.ball.move()
+        self.check_collision()
+
+        bx1, by1, bx2, by2 = self.ball.position()
+        if by2 >= self.height:
+            self.lives -= 1
+            if self.lives <= 0:
+                self.game_over()
+                return False
+            px = self.paddle.center_x
+            self.ball.place(px, self.height - 60)
+            self.started = False
+            self.canvas.itemconfigure(
+                self.instr, text="Press SPACE to START", state='normal'
+            )
+
+        if not self.bricks:
+            self.level += 1
+            self.ball.increase_speed(0.8)
+            self.build_level(self.level)
+            px = self.paddle.center_x
+            self.ball.place(px, self.height - 60)
+            self.started = False
+            self.canvas.itemconfigure(
+                self.instr, text=f"LEVEL {self.level}\nPress SPACE to START",
+                state='normal'
+            )
+        return True
+
     def loop(self):
-        if not self.paused and self.started:
-            self.ball.move()
-            self.check_collision()
-
-            bx1, by1, bx2, by2 = self.ball.position()
-            if by2 >= self.height:
-                self.lives -= 1
-                if self.lives <= 0:
-                    self.game_over()
+        if self.paused:
+            return
+        now = time.perf_counter()
+        if self.started:
+            # fixed-timestep physics, catching up at most MAX_STEPS per tick
+            self._acc += now - self._last_t
+            steps = 0
+            while self._acc >= FRAME_DT and steps < MAX_STEPS:
+                self._acc -= FRAME_DT
+                steps += 1
+                if not self.step():
                     return
-                px = (self.paddle.coords()[0] + self.paddle.coords()[2]) / 2
-                self.canvas.coords(self.ball.item, px-8, self.height-60-8, px+8, self.height-60+8)
-                self.started = False
-                self.instr = self.canvas.create_text(
-                    self.width/2, self.height/2,
-                    text="Press SPACE to START",
-                    font=('Helvetica', 26, 'bold'),
-                    fill='yellow'
-                )
-
-            if not self.bricks:
-                self.level += 1
-                self.ball.increase_speed(0.8)
-                self.build_level(self.level)
-                px = (self.paddle.coords()[0] + self.paddle.coords()[2]) / 2
-                self.canvas.coords(self.ball.item, px-8, self.height-60-8, px+8, self.height-60+8)
-                self.started = False
-                self.instr = self.canvas.create_text(
-                    self.width/2, self.height/2,
-                    text=f"LEVEL {self.level}\nPress SPACE to START",
-                    font=('Helvetica', 26, 'bold'),
-                    fill='yellow'
-                )
-
-        self.canvas.itemconfig(self.score_text, text=f"Score: {self.score}  Lives: {self.lives}")
-        self.canvas.itemconfig(self.level_text, text=f"Level: {self.level}")
-        self.root.after(16, self.loop)
+                if not self.started:
+                    break
+            self._acc = min(self._acc, FRAME_DT)
+        else:
+            self._acc = 0.0
+        self._last_t = now
+
+        score_str = f"Score: {self.score}  Lives: {self.lives}"
+        if score_str != self._last_score_str:
+            self.canvas.itemconfig(self.score_text, text=score_str)
+            self._last_score_str = score_str
+        level_str = f"Level: {self.level}"
+        if level_str != self._last_level_str:
+            self.canvas.itemconfig(self.level_text, text=level_str)
+            self._last_level_str = level_str
+        elapsed_ms = int((time.perf_counter() - now) * 1000)
+        self._after_id = self.root.after(max(1, FRAME_MS - elapsed_ms), self.loop)
 
     # ========== GAME OVER ==========
     def game_over(self):